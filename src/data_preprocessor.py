@@ -2,20 +2,284 @@ import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
+import os
 import re
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _STRING_DTYPE = 'string[pyarrow]'
+    # RE2 supersets of `standardizer.missing_patterns` and `_BOOL_OR_DATE_RE`; the candidates they keep are confirmed with `re`.
+    _MISSING_CANDIDATE_OPTIONS = pc.MatchSubstringOptions(
+        r'^(?i:[nat./]+|none\.?|null\.?)\n?$|^[\s\x{0b}\x{1c}-\x{1f}\x{85}\pZ]*$')
+    _BOOL_OR_DATE_CANDIDATE_OPTIONS = pc.MatchSubstringOptions(
+        r'^(?i:true|false)\n?$|^\p{Nd}{4}-?\p{Nd}{2}-?\p{Nd}{2}\n?$')
+except ImportError:
+    pa = None
+    _STRING_DTYPE = str
+    _MISSING_CANDIDATE_OPTIONS = _BOOL_OR_DATE_CANDIDATE_OPTIONS = None
+
+try:
+    from pandarallel import pandarallel
+except ImportError:
+    pandarallel = None
+
+_NULL_TOKENS = frozenset({'na', 'n.a.', 'n.a', 'n/a', 'nan', 'nat', 'none', 'none.', 'null', 'null.'})
+_PARALLEL_MIN_VALUES = 100000
+_BOOL_RE = re.compile(r'^True$|^False$', re.IGNORECASE)
+_DATE_RE = re.compile(r'^\d{4}[-]?\d{2}[-]?\d{2}$')
+_BOOL_OR_DATE_RE = re.compile(_BOOL_RE.pattern + '|' + _DATE_RE.pattern, re.IGNORECASE)
+_DATE_LIKE_RE = re.compile(r'\d{4}-?\d{1,2}-? ?\d{1,2}')
+
+def _check_columns(X):
+    """
+    Raise `ValueError` if the column names of `X` are not unique,
+    since the transformers select and rebuild the columns by name.
+
+    Parameters
+    ----------
+    X : DataFrame
+        Input data.
+    """
+
+    if not X.columns.is_unique:
+        raise ValueError("The column names of X must be unique.")
+
+def _assemble(X, columns_t):
+    """
+    Build the transformed dataframe in a single allocation,
+    taking the columns in `columns_t` and the untouched columns of `X` as they are.
+
+    Parameters
+    ----------
+    X : DataFrame
+        Input data.
+
+    columns_t : dict
+        Transformed columns keyed by column name.
+
+    Returns
+    -------
+    X_t : DataFrame
+        Transformed version of `X`.
+    """
+
+    # Passing `columns=` here makes pandas < 3 convert every column through an object array.
+    X_t = pd.DataFrame({col: columns_t[col] if col in columns_t else X[col] for col in X.columns},
+                       index=X.index, copy=False)
+    X_t.columns = X.columns
+    return X_t
+
+def _regex_candidates(tokens, options):
+    """
+    Narrow `tokens` down to the strings that can match a regular expression,
+    scanning them in one Arrow kernel call when pyarrow is installed.
+
+    Parameters
+    ----------
+    tokens : array-like of str
+        Distinct strings of a column.
+
+    options : pyarrow.compute.MatchSubstringOptions or None
+        RE2 superset of the regular expression the candidates are then checked against.
+
+    Returns
+    -------
+    candidates : array-like of str
+        The matching strings, or `tokens` unchanged without pyarrow.
+    """
+
+    if pa is None:
+        return tokens
+    tokens = pa.array(tokens, type=pa.string())
+    return pc.filter(tokens, pc.match_substring_regex(tokens, options=options)).to_pylist()
+
+def _effective_n_jobs(n_jobs):
+    """
+    Resolve `n_jobs` to a number of workers as scikit-learn does:
+    negative values count back from the number of CPUs, so `-1` uses all of them.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        Requested number of workers; `None` is returned unchanged.
+
+    Returns
+    -------
+    n_workers : int or None
+    """
+
+    if n_jobs is None or n_jobs > 0:
+        return n_jobs
+    if n_jobs == 0:
+        raise ValueError("n_jobs == 0 has no meaning.")
+    return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+
+def _transform_columns(X, columns_set, transform_column, n_jobs):
+    """
+    Transform the columns of `X` in `columns_set` concurrently with `transform_column`;
+    the columns of `columns_set` missing from `X` are skipped.
+
+    Parameters
+    ----------
+    X : DataFrame
+        Input data.
+
+    columns_set : set-like
+        Names of the columns to be transformed.
+
+    transform_column : callable
+        Transforms a column.
+
+    n_jobs : int or None
+        Maximum number of threads, resolved by `_effective_n_jobs`;
+        `None` uses the `ThreadPoolExecutor` default, and `1` transforms the columns in the calling thread.
+
+    Returns
+    -------
+    columns_t : dict
+        Transformed columns keyed by column name, in the order of `X.columns`.
+    """
+
+    _check_columns(X)
+    columns = [col for col in X.columns if col in columns_set]
+    # Indexing `X` is not thread-safe on pandas < 3, so the columns are selected before dispatching.
+    series = [X[col] for col in columns]
+    n_workers = _effective_n_jobs(n_jobs)
+    if n_workers == 1:
+        return dict(zip(columns, map(transform_column, series)))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        return dict(zip(columns, executor.map(transform_column, series)))
+
+def _fit_columns(X, transform_column, n_jobs):
+    """
+    Transform the columns of `X` concurrently with `transform_column`,
+    keeping only the columns it accepts.
+
+    Parameters
+    ----------
+    X : DataFrame
+        Input data.
+
+    transform_column : callable
+        Transforms a column, raising `ValueError` if the column cannot be transformed.
+
+    n_jobs : int or None
+        Maximum number of threads, resolved by `_effective_n_jobs`;
+        `None` uses the `ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    columns_t : dict
+        Transformed columns keyed by column name, in the order of `X.columns`.
+    """
+
+    def probe(s):
+        try:
+            return transform_column(s)
+        except ValueError:
+            return None
+
+    columns_t = _transform_columns(X, X.columns, probe, n_jobs)
+    return {col: s_t for col, s_t in columns_t.items() if s_t is not None}
+
+def _fit_transformer(transformer, X, fit_column, n_jobs):
+    """
+    Find the columns of `X` accepted by `fit_column`
+    and store their names in `transformer.columns` and `transformer.columns_set`.
+
+    Parameters
+    ----------
+    transformer : estimator
+        Transformer being fitted.
+
+    X : DataFrame
+        Input data.
+
+    fit_column : callable
+        Transforms a column, raising `ValueError` if the column cannot be transformed.
+
+    n_jobs : int or None
+        Maximum number of threads, as in `_transform_columns`.
+
+    Returns
+    -------
+    columns_t : dict
+        Transformed columns keyed by column name, in the order of `X.columns`.
+    """
+
+    columns_t = _fit_columns(X, fit_column, n_jobs)
+    transformer.columns = list(columns_t)
+    transformer.columns_set = frozenset(transformer.columns)
+    return columns_t
+
+def _null_mask(s):
+    """
+    Mask the null values of `s` together with the '' and ' ' strings
+    the transformers treat as null.
+
+    Parameters
+    ----------
+    s : Series
+        Column of a dataframe.
+
+    Returns
+    -------
+    null_mask : ndarray of bool
+    """
+
+    return (s.isna() | s.isin(['', ' '])).to_numpy()
+
+def _is_float_column(s, null_mask):
+    """
+    Check whether every not-null value of `s` can be converted by `float`,
+    in one vectorized conversion instead of a Python call per value.
+
+    Parameters
+    ----------
+    s : Series
+        Column of a dataframe.
+
+    null_mask : ndarray of bool
+        `_null_mask(s)`; the masked values are skipped.
+
+    Returns
+    -------
+    bool
+    """
+
+    if s.dtype.kind in 'biuf':
+        return True
+    if s.dtype.kind in 'cmM':
+        return bool(null_mask.all())
+    try:
+        s.mask(null_mask).to_numpy(dtype=float, na_value=np.nan)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    return True
+
 class standardizer(BaseEstimator, TransformerMixin):
     """
     Class to standardize all null values and white space(s) strings to np.nan.
     
+    Parameters
+    ----------
+    n_jobs : int, default=None
+        Maximum number of threads used to transform the columns concurrently;
+        `None` uses the `ThreadPoolExecutor` default,
+        and negative values count back from the number of CPUs, so `-1` uses all of them.
+
     Attributes
     ----------
     null_patterns : compiled regular expressions for null values
     empty_patterns : compiled regular expressions for empty values
-    true_patterns : compiled regular expressions for true values
-    false_patterns : compiled regular expressions for false values
+    missing_patterns : compiled union of `null_patterns` and `empty_patterns`
     columns : list of column names to be transformed
+    columns_set : frozenset of `columns`
+    object_columns : list of column names in `columns` whose dtype can hold null or white space(s) strings
+    object_columns_set : frozenset of `object_columns`
     
     Examples:
     >>> s = standardizer()
@@ -37,11 +301,27 @@ class standardizer(BaseEstimator, TransformerMixin):
     7       2.5   False      1234    20230630
     8       3.8   False       234    20230630
     9       NaN     NaN        12         NaN
-    
+
+    `None` values are standardized to np.nan as well.
+    >>> s.fit_transform(pd.DataFrame({'Flag':[True,False,None]}))
+        Flag
+    0   True
+    1  False
+    2    NaN
+
+    The fitted columns missing from the transformed dataframe are skipped.
+    >>> df = pd.DataFrame({'a':['1','NA'],'b':['2023-06-28','NA']})
+    >>> s.fit(df).transform(df[['b']])
+                b
+    0  2023-06-28
+    1         NaN
+
     """
-    def __init__(self):
+    def __init__(self, n_jobs = None):
+        self.n_jobs = n_jobs
         self.null_patterns = re.compile(r'^N[./]*A[./]*[NT]?[./]*$|^none[.]?$|^null[.]?$', re.IGNORECASE)
         self.empty_patterns = re.compile(r'^\s*$', re.IGNORECASE)
+        self.missing_patterns = re.compile(self.null_patterns.pattern + '|' + self.empty_patterns.pattern, re.IGNORECASE)
 
     def fit(self, X, y = None):
         """
@@ -64,20 +344,50 @@ class standardizer(BaseEstimator, TransformerMixin):
             Fitted estimator.
         """
 
-        columns = []
-        for col in X.columns:
-            try:
-                X[col].apply(lambda x: np.nan if bool(self.null_patterns.search(str(x))) else x)
-                X[col].apply(lambda x: np.nan if bool(self.empty_patterns.search(str(x))) else x)
-                columns.append(col)
-            except:
-                pass
-        self.columns = columns
+        _check_columns(X)
+        self.columns = list(X.columns)
+        self.columns_set = frozenset(self.columns)
+        self.object_columns = [col for col in self.columns if X[col].dtype.kind not in 'biufcmM']
+        self.object_columns_set = frozenset(self.object_columns)
         return self
 
+    def _transform_column(self, s):
+        """
+        Standardize the null values and white space(s) strings of column `s` to np.nan.
+
+        Parameters
+        ----------
+        s : Series
+            A column of a dataframe.
+
+        Returns
+        -------
+        s_t : Series
+            Transformed version of `s`.
+        """
+
+        missing_mask = s.isna().to_numpy(copy=True)
+        s_str = s[~missing_mask].astype(_STRING_DTYPE)
+        tokens = _regex_candidates(s_str.unique(), _MISSING_CANDIDATE_OPTIONS)
+        missing_tokens = [x for x in tokens if x.lower() in _NULL_TOKENS or self.missing_patterns.search(x)]
+        # Object columns may hold `None` or `NaT` instead of np.nan; other columns already hold their own null value.
+        has_other_nulls = s.dtype == object and any(not isinstance(x, float) for x in s.to_numpy()[missing_mask])
+        if missing_tokens:
+            missing_mask[~missing_mask] = s_str.isin(missing_tokens).to_numpy()
+        if missing_tokens or has_other_nulls:
+            values = s.to_numpy(dtype=object, copy=True)
+            values[missing_mask] = np.nan
+            s = pd.Series(values, index=s.index, name=s.name, dtype=object)
+        try:
+            return s.infer_objects()
+        except OverflowError:
+            # An int too large for a float keeps the column in object dtype.
+            return s
+
     def transform(self, X, y=None):
         """
-        Transform `X`.
+        Transform `X`;
+        the fitted columns missing from `X` are skipped.
 
         Parameters
         ----------
@@ -94,12 +404,8 @@ class standardizer(BaseEstimator, TransformerMixin):
             Transformed version of `X`.
         """
 
-        check_is_fitted(self,['columns'])
-        X_t = X.copy()
-        for col in self.columns:
-            X_t[col] = X_t[col].apply(lambda x: np.nan if bool(self.null_patterns.search(str(x))) else x)
-            X_t[col] = X_t[col].apply(lambda x: np.nan if bool(self.empty_patterns.search(str(x))) else x)
-        return X_t
+        check_is_fitted(self,['columns', 'object_columns_set'])
+        return _assemble(X, _transform_columns(X, self.object_columns_set, self._transform_column, self.n_jobs))
 
 class numerical_transformer(BaseEstimator, TransformerMixin):
     """
@@ -107,9 +413,17 @@ class numerical_transformer(BaseEstimator, TransformerMixin):
     Transform all not-null values within the column to `float`,
     transform all null values within the column to empty string ''.
     
+    Parameters
+    ----------
+    n_jobs : int, default=None
+        Maximum number of threads used to probe and transform the columns concurrently;
+        `None` uses the `ThreadPoolExecutor` default,
+        and negative values count back from the number of CPUs, so `-1` uses all of them.
+
     Attributes
     ----------
     columns : list of column names to be transformed
+    columns_set : frozenset of `columns`
     
     Examples:
     >>> n = numerical_transformer()
@@ -131,30 +445,46 @@ class numerical_transformer(BaseEstimator, TransformerMixin):
     7       2.5   False      1234    20230630
     8       3.8   False       234    20230630
     9               NaN        12         NaN
-    
+
+    The fitted columns missing from the transformed dataframe are skipped.
+    >>> df = pd.DataFrame({'a':['1',' '],'b':['2.5',' ']})
+    >>> n.fit(df).transform(df[['b']])
+         b
+    0  2.5
+    1     
+
     """
 
-    def _convert_to_float(self, x):
+    def __init__(self, n_jobs = None):
+        self.n_jobs = n_jobs
+
+    def _transform_column(self, s):
         """
-        Convert `x` to float if `x` has no poyential to be a boolean or date;
-        Else raise `ValueError`.
+        Convert the not-null values of column `s` to float and the null values to '';
+        Raise `ValueError` if any value has potential to be a boolean or date,
+        or cannot be converted to float.
 
         Parameters
         ----------
-        x : value in a column of a dataframe.
-        
+        s : Series
+            A column of a dataframe.
+
         Returns
         -------
-        float(x) : float
-            float type of `x`.    
+        s_t : Series
+            Transformed version of `s`.
         """
 
-        bool_patterns = re.compile(r'^True$|^False$', re.IGNORECASE)
-        date_patterns = re.compile(r'^\d{4}[-]?\d{2}[-]?\d{2}$')
-        if bool_patterns.search(str(x)) or date_patterns.search(str(x)):
+        null_mask = _null_mask(s)
+        if s.dtype.kind in 'cmM' and not null_mask.all():
             raise ValueError("The value cannot be converted to float.")
-        else:
-            return float(x)
+        if s.dtype.kind != 'f':
+            tokens = s[~null_mask]
+            tokens = [str(x) for x in tokens.unique()] if tokens.dtype.kind in 'biu' else tokens.astype(str).unique()
+            if any(_BOOL_OR_DATE_RE.search(x) for x in _regex_candidates(tokens, _BOOL_OR_DATE_CANDIDATE_OPTIONS)):
+                raise ValueError("The value cannot be converted to float.")
+        values = s.mask(null_mask).to_numpy(dtype=float, na_value=np.nan)
+        return pd.Series(values, index=s.index, name=s.name).where(~null_mask, '').infer_objects()
 
     def fit(self, X, y = None):
         """
@@ -177,19 +507,36 @@ class numerical_transformer(BaseEstimator, TransformerMixin):
             Fitted estimator.
         """
 
-        columns = []
-        for col in X.columns:
-            try:
-                X[col].apply(lambda x: '' if pd.isnull(x) or x in ['', ' '] else self._convert_to_float(x))
-                columns.append(col)
-            except ValueError:
-                pass
-        self.columns = columns
+        _fit_transformer(self, X, self._transform_column, self.n_jobs)
         return self
 
     def transform(self, X, y = None):
         """
-        Transform `X`.
+        Transform `X`;
+        the fitted columns missing from `X` are skipped.
+
+        Parameters
+        ----------
+        X : dataframe of shape (n_samples, n_features)
+            Input data, where `n_samples` is the number of samples and
+            `n_features` is the number of features.
+        
+        y : Ignored
+            Not used, present here for API consistency by convention.
+        
+        Returns
+        -------
+        X_t : DataFrame
+            Transformed version of `X`.
+        """
+
+        check_is_fitted(self,['columns', 'columns_set'])
+        return _assemble(X, _transform_columns(X, self.columns_set, self._transform_column, self.n_jobs))
+
+    def fit_transform(self, X, y = None):
+        """
+        Fit the transformer on `X` and transform it,
+        converting each column only once instead of once in `fit` and again in `transform`.
 
         Parameters
         ----------
@@ -206,11 +553,7 @@ class numerical_transformer(BaseEstimator, TransformerMixin):
             Transformed version of `X`.
         """
 
-        check_is_fitted(self,['columns'])
-        X_t = X.copy()
-        for col in self.columns:
-            X_t[col] = X_t[col].apply(lambda x: '' if pd.isnull(x) or x in ['', ' '] else self._convert_to_float(x))
-        return X_t
+        return _assemble(X, _fit_transformer(self, X, self._transform_column, self.n_jobs))
     
 class date_transformer(BaseEstimator, TransformerMixin):
     """
@@ -218,9 +561,31 @@ class date_transformer(BaseEstimator, TransformerMixin):
     Transform all not-null values within the column to sting in `YYYY-MM-DD` format,
     transform all null values within the column to single space string ' '.
     
+    Parameters
+    ----------
+    n_jobs : int, default=None
+        Maximum number of threads used to probe and transform the columns concurrently;
+        `None` uses the `ThreadPoolExecutor` default,
+        and negative values count back from the number of CPUs, so `-1` uses all of them.
+        With `engine='pandarallel'` it is the number of `pandarallel` workers instead,
+        and the columns are transformed one at a time.
+
+    engine : {'pandas', 'pandarallel'}, default='pandas'
+        Engine used for the values the vectorized parser cannot handle;
+        'pandarallel' spreads them across processes once there are at least 100000 distinct ones.
+        On pandas >= 3 the vectorized parser handles every date written with ASCII digits,
+        so only some dates written with other Unicode digits reach the engine and it is practically never used.
+
+    keep_datetime : bool, default=False
+        If True, transform the dates to `datetime64[s]` and the null values to `NaT`
+        instead of `YYYY-MM-DD` strings and ' '.
+        `string_transformer` converts `datetime64` columns to strings,
+        so in a pipeline put this transformer after it.
+
     Attributes
     ----------
     columns : list of column names to be transformed
+    columns_set : frozenset of `columns`
     
     Examples:
     >>> d = date_transformer()
@@ -243,11 +608,55 @@ class date_transformer(BaseEstimator, TransformerMixin):
     8       3.8   False       234  2023-06-30
     9       NaN     NaN        12            
 
+    With `keep_datetime=True`, the dates stay `datetime64[s]` and the null values become `NaT`.
+    >>> date_transformer(keep_datetime=True).fit_transform(df)['Date']
+    0   2023-06-28
+    1          NaT
+    2          NaT
+    3          NaT
+    4          NaT
+    5          NaT
+    6   2023-06-29
+    7   2023-06-30
+    8   2023-06-30
+    9          NaT
+    Name: Date, dtype: datetime64[s]
+
+    In a pipeline, `keep_datetime=True` needs the `date_transformer` after the `string_transformer`.
+    >>> from sklearn.pipeline import Pipeline
+    >>> pipeline = Pipeline(steps=[
+    ...          ('standardize', standardizer()),
+    ...          ('numerical', numerical_transformer()),
+    ...          ('string', string_transformer()),
+    ...          ('date', date_transformer(keep_datetime=True)),
+    ...          ('boolean', boolean_transformer())])
+    >>> df_p = pd.DataFrame({
+    ...          'Numerical':['123',' ','2.5'],
+    ...          'Character':['abc','NA','cde'],
+    ...          'Date':['2023-06-28','None',20230629]})
+    >>> pipeline.fit_transform(df_p)
+      Numerical Character       Date
+    0     123.0       abc 2023-06-28
+    1                            NaT
+    2       2.5       cde 2023-06-29
+
+    The fitted columns missing from the transformed dataframe are skipped.
+    >>> df = pd.DataFrame({'a':['20230628',' '],'b':['2023-06-29',' ']})
+    >>> d.fit(df).transform(df[['b']])
+                b
+    0  2023-06-29
+    1            
+
     """
 
-    def _convert_to_date(self, x):
+    def __init__(self, n_jobs = None, engine = 'pandas', keep_datetime = False):
+        self.n_jobs = n_jobs
+        self.engine = engine
+        self.keep_datetime = keep_datetime
+
+    def _parse_date(self, x):
         """
-        Convert `x` to date string `YYYY-MM-DD` if `x` has potential to be a date;
+        Parse `x` to a datetime if `x` has potential to be a date;
         Else raise `ValueError`.
 
         Parameters
@@ -256,18 +665,106 @@ class date_transformer(BaseEstimator, TransformerMixin):
         
         Returns
         -------
-        str type of `x` in `YYYY-MM-DD` format.
+        datetime of `x` at midnight.
         """
 
-        try:
-            return dt.strptime(str(x), '%Y-%m-%d').date().strftime('%Y-%m-%d')
-        except:
+        x = str(x)
+        if _DATE_LIKE_RE.fullmatch(x):
             try:
-                return dt.strptime(str(x), '%Y%m%d').date().strftime('%Y-%m-%d')
+                return dt.strptime(x, '%Y-%m-%d' if '-' in x else '%Y%m%d')
             except ValueError:
                 pass
         raise ValueError(f"Cannot convert {x} to a date with the given formats.")
 
+    def _convert_to_date(self, x):
+        """
+        Convert `x` to date string `YYYY-MM-DD` if `x` has potential to be a date;
+        Else raise `ValueError`.
+
+        Parameters
+        ----------
+        x : value in a column of a dataframe.
+        
+        Returns
+        -------
+        str type of `x` in `YYYY-MM-DD` format.
+        """
+
+        return self._parse_date(x).date().strftime('%Y-%m-%d')
+
+    def _init_engine(self):
+        """
+        Raise `ValueError` if `engine` is unknown, or `ImportError` if it is not installed;
+        Else initialize `pandarallel` once, before the columns are dispatched to the threads.
+        """
+
+        if self.engine not in ('pandas', 'pandarallel'):
+            raise ValueError(f"Unknown engine {self.engine!r}; expected 'pandas' or 'pandarallel'.")
+        if self.engine == 'pandarallel':
+            if pandarallel is None:
+                raise ImportError("engine='pandarallel' requires the pandarallel package.")
+            if self.n_jobs is None:
+                pandarallel.initialize(progress_bar=False, verbose=0)
+            else:
+                pandarallel.initialize(nb_workers=_effective_n_jobs(self.n_jobs), progress_bar=False, verbose=0)
+
+    def _n_threads(self):
+        """
+        Number of threads the columns are dispatched to;
+        `pandarallel` forks its workers, which can deadlock a multi-threaded process,
+        so with `engine='pandarallel'` the columns are transformed in the calling thread.
+        """
+
+        return 1 if self.engine == 'pandarallel' else self.n_jobs
+
+    def _transform_column(self, s):
+        """
+        Convert the not-null values of column `s` to date strings in `YYYY-MM-DD` format
+        and the null values to ' '; Raise `ValueError` if any value cannot be converted.
+
+        Parameters
+        ----------
+        s : Series
+            A column of a dataframe.
+
+        Returns
+        -------
+        s_t : Series
+            Transformed version of `s`.
+        """
+
+        not_null = ~_null_mask(s)
+        # `str` of a datetime or timedelta value carries its time, so such columns are not `YYYY-MM-DD` dates.
+        if s.dtype.kind in 'bfcmM' and not_null.any():
+            raise ValueError("Cannot convert the column to a date with the given formats.")
+        s_str = s[not_null].astype(str)
+        if not all(_DATE_LIKE_RE.fullmatch(x) for x in s_str.unique()):
+            raise ValueError("Cannot convert the column to a date with the given formats.")
+        dates = pd.to_datetime(s_str, format='%Y-%m-%d', errors='coerce')
+        unparsed_mask = dates.isna()
+        if unparsed_mask.any():
+            dates = dates.fillna(pd.to_datetime(s_str.where(unparsed_mask), format='%Y%m%d', errors='coerce'))
+        # `strptime` has no year 0, which pandas >= 3 parses; leave it to `_convert_to_date` to reject.
+        dates = dates.mask(dates.dt.year < 1)
+        if self.keep_datetime:
+            values = np.full(len(s), np.datetime64('NaT'), dtype='datetime64[s]')
+            values[not_null] = dates.to_numpy(dtype='datetime64[s]')
+            convert = self._parse_date
+        else:
+            values = np.full(len(s), ' ', dtype=object)
+            values[not_null] = dates.dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+            convert = self._convert_to_date
+        unparsed = dates.isna().to_numpy()
+        if unparsed.any():
+            s_unparsed = s_str[unparsed]
+            tokens = pd.Series(s_unparsed.unique(), dtype=object)
+            if self.engine == 'pandarallel' and len(tokens) >= _PARALLEL_MIN_VALUES:
+                converted = tokens.parallel_map(convert)
+            else:
+                converted = tokens.map(convert)
+            values[np.flatnonzero(not_null)[unparsed]] = s_unparsed.map(dict(zip(tokens, converted))).to_numpy(dtype=values.dtype)
+        return pd.Series(values, index=s.index, name=s.name).infer_objects()
+
     def fit(self, X, y = None):
         """
         Fit the transformer on `X`.
@@ -289,19 +786,38 @@ class date_transformer(BaseEstimator, TransformerMixin):
             Fitted estimator.
         """
 
-        columns = []
-        for col in X.columns:
-            try:
-                X[col].apply(lambda x: ' ' if pd.isnull(x) or x in ['', ' '] else self._convert_to_date(x))
-                columns.append(col)
-            except ValueError:
-                pass
-        self.columns = columns
+        self._init_engine()
+        _fit_transformer(self, X, self._transform_column, self._n_threads())
         return self
 
     def transform(self, X, y = None):
         """
-        Transform `X`.
+        Transform `X`;
+        the fitted columns missing from `X` are skipped.
+
+        Parameters
+        ----------
+        X : dataframe of shape (n_samples, n_features)
+            Input data, where `n_samples` is the number of samples and
+            `n_features` is the number of features.
+        
+        y : Ignored
+            Not used, present here for API consistency by convention.
+        
+        Returns
+        -------
+        X_t : DataFrame
+            Transformed version of `X`.
+        """
+
+        check_is_fitted(self,['columns', 'columns_set'])
+        self._init_engine()
+        return _assemble(X, _transform_columns(X, self.columns_set, self._transform_column, self._n_threads()))
+
+    def fit_transform(self, X, y = None):
+        """
+        Fit the transformer on `X` and transform it,
+        converting each column only once instead of once in `fit` and again in `transform`.
 
         Parameters
         ----------
@@ -318,11 +834,8 @@ class date_transformer(BaseEstimator, TransformerMixin):
             Transformed version of `X`.
         """
 
-        check_is_fitted(self,['columns'])
-        X_t = X.copy()
-        for col in self.columns:
-            X_t[col] = X_t[col].apply(lambda x: ' ' if pd.isnull(x) or x in ['', ' '] else self._convert_to_date(x))
-        return X_t
+        self._init_engine()
+        return _assemble(X, _fit_transformer(self, X, self._transform_column, self._n_threads()))
 
 class string_transformer(BaseEstimator, TransformerMixin):
     """
@@ -330,9 +843,17 @@ class string_transformer(BaseEstimator, TransformerMixin):
     Transform all not-null values within the column to string,
     transform all null values within the column to single space string ' '.
     
+    Parameters
+    ----------
+    n_jobs : int, default=None
+        Maximum number of threads used to probe and transform the columns concurrently;
+        `None` uses the `ThreadPoolExecutor` default,
+        and negative values count back from the number of CPUs, so `-1` uses all of them.
+
     Attributes
     ----------
     columns : list of column names to be transformed
+    columns_set : frozenset of `columns`
     
     Examples:
     >>> s = string_transformer()
@@ -354,30 +875,71 @@ class string_transformer(BaseEstimator, TransformerMixin):
     7       2.5   False      1234    20230630
     8       3.8   False       234    20230630
     9       NaN     NaN        12         NaN
-    
+
+    The fitted columns missing from the transformed dataframe are skipped.
+    >>> df = pd.DataFrame({'a':['abc',' '],'b':['cde',' ']})
+    >>> s.fit(df).transform(df[['b']])
+         b
+    0  cde
+    1     
+
     """
 
-    def _convert_to_string(self, x):
+    def __init__(self, n_jobs = None):
+        self.n_jobs = n_jobs
+
+    def _transform_column(self, s, null_mask = None):
         """
-        Convert `x` to string type if `x` has no potential to be a boolean or date;
-        Else raise `ValueError`.
+        Convert the not-null values of column `s` to string and the null values to ' ';
+        Raise `ValueError` if any value has potential to be a boolean or date.
 
         Parameters
         ----------
-        x : value in a column of a dataframe.
-        
+        s : Series
+            A column of a dataframe.
+
+        null_mask : ndarray of bool, default=None
+            `_null_mask(s)` if already computed.
+
         Returns
         -------
-        str(x) : str
-            string type of `x`.
+        s_t : Series
+            Transformed version of `s`.
         """
 
-        bool_patterns = re.compile(r'^True$|^False$', re.IGNORECASE)
-        date_patterns = re.compile(r'^\d{4}[-]?\d{2}[-]?\d{2}$')
-        if bool_patterns.search(str(x)) or date_patterns.search(str(x)):
+        not_null = ~(_null_mask(s) if null_mask is None else null_mask)
+        if s.dtype.kind == 'b' and not_null.any():
             raise ValueError("The value cannot be converted to string.")
-        else:
-            return str(x)
+        # `astype(str)` drops the midnight time of datetimes and timedeltas, which `str` keeps.
+        s_str = s[not_null].map(str) if s.dtype.kind in 'mM' else s[not_null].astype(str)
+        if any(_BOOL_OR_DATE_RE.search(x) for x in _regex_candidates(s_str.unique(), _BOOL_OR_DATE_CANDIDATE_OPTIONS)):
+            raise ValueError("The value cannot be converted to string.")
+        if not_null.all():
+            return s_str
+        values = np.full(len(s), ' ', dtype=object)
+        values[not_null] = s_str.to_numpy(dtype=object)
+        return pd.Series(values, index=s.index, name=s.name).infer_objects()
+
+    def _fit_column(self, s):
+        """
+        Transform column `s` like `_transform_column`,
+        but raise `ValueError` if all its values can be converted to float.
+
+        Parameters
+        ----------
+        s : Series
+            A column of a dataframe.
+
+        Returns
+        -------
+        s_t : Series
+            Transformed version of `s`.
+        """
+
+        null_mask = _null_mask(s)
+        if _is_float_column(s, null_mask):
+            raise ValueError("The column can be converted to float.")
+        return self._transform_column(s, null_mask)
 
     def fit(self, X, y = None):
         """
@@ -400,22 +962,36 @@ class string_transformer(BaseEstimator, TransformerMixin):
             Fitted estimator.
         """
 
-        columns = []
-        for col in X.columns:
-            try:
-                X[col].apply(lambda x: '' if pd.isnull(x) or x in ['', ' '] else float(x))
-            except:
-                try:
-                    X[col].apply(lambda x: ' ' if pd.isnull(x) or x in ['', ' '] else self._convert_to_string(x))
-                    columns.append(col)
-                except ValueError:
-                    pass
-        self.columns = columns
+        _fit_transformer(self, X, self._fit_column, self.n_jobs)
         return self
 
     def transform(self, X, y = None):
         """
-        Transform `X`.
+        Transform `X`;
+        the fitted columns missing from `X` are skipped.
+
+        Parameters
+        ----------
+        X : dataframe of shape (n_samples, n_features)
+            Input data, where `n_samples` is the number of samples and
+            `n_features` is the number of features.
+        
+        y : Ignored
+            Not used, present here for API consistency by convention.
+        
+        Returns
+        -------
+        X_t : DataFrame
+            Transformed version of `X`.
+        """
+
+        check_is_fitted(self,['columns', 'columns_set'])
+        return _assemble(X, _transform_columns(X, self.columns_set, self._transform_column, self.n_jobs))
+
+    def fit_transform(self, X, y = None):
+        """
+        Fit the transformer on `X` and transform it,
+        converting each column only once instead of once in `fit` and again in `transform`.
 
         Parameters
         ----------
@@ -432,11 +1008,7 @@ class string_transformer(BaseEstimator, TransformerMixin):
             Transformed version of `X`.
         """
 
-        check_is_fitted(self,['columns'])
-        X_t = X.copy()
-        for col in self.columns:
-            X_t[col] = X_t[col].apply(lambda x: ' ' if pd.isnull(x) or x in ['', ' '] else self._convert_to_string(x))
-        return X_t
+        return _assemble(X, _fit_transformer(self, X, self._fit_column, self.n_jobs))
     
 class boolean_transformer(BaseEstimator, TransformerMixin):
     """
@@ -444,9 +1016,17 @@ class boolean_transformer(BaseEstimator, TransformerMixin):
     Transform all not-null values within the column to boolean,
     transform all null values within the column to empty string ''.
     
+    Parameters
+    ----------
+    n_jobs : int, default=None
+        Maximum number of threads used to probe and transform the columns concurrently;
+        `None` uses the `ThreadPoolExecutor` default,
+        and negative values count back from the number of CPUs, so `-1` uses all of them.
+
     Attributes
     ----------
     columns : list of column names to be transformed
+    columns_set : frozenset of `columns`
     
     Examples:
     >>> b = boolean_transformer()
@@ -468,28 +1048,57 @@ class boolean_transformer(BaseEstimator, TransformerMixin):
     7       2.5   False      1234    20230630
     8       3.8   False       234    20230630
     9       NaN                12         NaN
-    
+
+    The strings 'True' and 'False' are matched case-insensitively.
+    >>> df = pd.DataFrame({'Flag':['True','False','false',np.nan]})
+    >>> b.fit_transform(df)
+        Flag
+    0   True
+    1  False
+    2  False
+    3       
+
+    The fitted columns missing from the transformed dataframe are skipped.
+    >>> df = pd.DataFrame({'a':['True',' '],'b':['false',' ']})
+    >>> b.fit(df).transform(df[['b']])
+           b
+    0  False
+    1       
+
     """
 
-    def _convert_to_boolean(self, x):
+    def __init__(self, n_jobs = None):
+        self.n_jobs = n_jobs
+
+    def _transform_column(self, s):
         """
-        Convert `x` to boolean type if `x` has potential to be a boolean;
-        Else raise `ValueError`.
+        Convert the not-null values of column `s` to boolean and the null values to '';
+        Raise `ValueError` if any value cannot be 'True' or 'False'.
 
         Parameters
         ----------
-        x : value in a column of a dataframe.
-        
+        s : Series
+            A column of a dataframe.
+
         Returns
         -------
-        bool(x) : bool
-            boolean type of `x`.
+        s_t : Series
+            Transformed version of `s`.
         """
-        bool_patterns = re.compile(r'^True$|^False$', re.IGNORECASE)
-        if not bool_patterns.search(str(x)):
+
+        not_null = ~_null_mask(s)
+        if s.dtype.kind in 'iufcmM' and not_null.any():
             raise ValueError("The value cannot be 'True' or 'False'.")
-        else:
-            return bool(x)
+        s_str = s[not_null].astype(str)
+        tokens = s_str.unique()
+        if not all(_BOOL_RE.search(x) for x in tokens):
+            raise ValueError("The value cannot be 'True' or 'False'.")
+        is_true = s_str.isin([x for x in tokens if x.rstrip('\n').lower() == 'true']).to_numpy()
+        if not_null.all():
+            return pd.Series(is_true, index=s.index, name=s.name)
+        values = np.full(len(s), '', dtype=object)
+        values[not_null] = is_true.tolist()
+        return pd.Series(values, index=s.index, name=s.name).infer_objects()
 
     def fit(self, X, y = None):
         """
@@ -512,19 +1121,36 @@ class boolean_transformer(BaseEstimator, TransformerMixin):
             Fitted estimator.
         """
 
-        columns = []
-        for col in X.columns:
-            try:
-                X[col].apply(lambda x: '' if pd.isnull(x) or x in ['', ' '] else self._convert_to_boolean(x))
-                columns.append(col)
-            except ValueError:
-                pass
-        self.columns = columns
+        _fit_transformer(self, X, self._transform_column, self.n_jobs)
         return self
 
     def transform(self, X, y = None):
         """
-        Transform `X`.
+        Transform `X`;
+        the fitted columns missing from `X` are skipped.
+
+        Parameters
+        ----------
+        X : dataframe of shape (n_samples, n_features)
+            Input data, where `n_samples` is the number of samples and
+            `n_features` is the number of features.
+        
+        y : Ignored
+            Not used, present here for API consistency by convention.
+        
+        Returns
+        -------
+        X_t : DataFrame
+            Transformed version of `X`.
+        """
+
+        check_is_fitted(self,['columns', 'columns_set'])
+        return _assemble(X, _transform_columns(X, self.columns_set, self._transform_column, self.n_jobs))
+
+    def fit_transform(self, X, y = None):
+        """
+        Fit the transformer on `X` and transform it,
+        converting each column only once instead of once in `fit` and again in `transform`.
 
         Parameters
         ----------
@@ -541,8 +1167,4 @@ class boolean_transformer(BaseEstimator, TransformerMixin):
             Transformed version of `X`.
         """
 
-        check_is_fitted(self,['columns'])
-        X_t = X.copy()
-        for col in self.columns:
-            X_t[col] = X_t[col].apply(lambda x: '' if pd.isnull(x) or x in ['', ' '] else self._convert_to_boolean(x))
-        return X_t
+        return _assemble(X, _fit_transformer(self, X, self._transform_column, self.n_jobs))